@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import BinaryIO, TypeAlias, cast
+from typing import TYPE_CHECKING, BinaryIO, TypeAlias, cast
 
 from ._workbook import Workbook
 from .nodes import (
@@ -22,6 +22,9 @@ from .nodes import (
 )
 from .styles import Style, normalize_hex
 
+if TYPE_CHECKING:
+    from openpyxl import Workbook as OpenpyxlWorkbook
+
 __all__ = [
     "cell",
     "col",
@@ -163,23 +166,16 @@ def _rows_from_dict_of_lists(
         raise ValueError(msg)
 
     row_count = lengths.pop() if lengths else 0
-    body_rows: list[RowNode] = []
-    for idx in range(row_count):
-        body_rows.append(
-            RowNode(
-                cells=tuple(
-                    _ensure_cell(
-                        normalized[col][idx]
-                        if col in normalized and idx < len(normalized[col])
-                        else None
-                    )
-                    for col in columns
-                )
-            )
-        )
+    # Walk the columns in lockstep instead of indexing every column per row;
+    # columns named only in column_order are padded with blanks.
+    column_values = [normalized.get(col, (None,) * row_count) for col in columns]
+    body_rows = tuple(
+        RowNode(cells=tuple(_ensure_cell(value) for value in values))
+        for values in zip(*column_values)
+    )
 
     header_node = _coerce_row(columns, extra_styles=header_styles)
-    return tuple(body_rows), header_node
+    return body_rows, header_node
 
 
 class _BuilderBase:
@@ -233,18 +229,24 @@ class TableBuilder(_BuilderBase):
         styles: Sequence[Style] | None = None,
         header_style: Sequence[Style] | None = None,
         columns: Sequence[ColumnKey] | None = None,
+        column_styles: Mapping[ColumnKey, Sequence[Style]] | None = None,
     ) -> None:
         super().__init__(styles=styles)
         self._header_styles: tuple[Style, ...] = tuple(header_style or ())
         self._columns: tuple[ColumnKey, ...] | None = (
             tuple(columns) if columns is not None else None
         )
+        self._column_styles: dict[ColumnKey, tuple[Style, ...]] = {
+            key: tuple(value) for key, value in (column_styles or {}).items()
+        }
 
     def __getitem__(
         self,
         rows: Sequence[RowNode]
         | Sequence[Sequence[CellSource]]
         | Sequence[Mapping[ColumnKey, CellSource]]
+        | Iterator[Sequence[CellSource]]
+        | Iterator[Mapping[ColumnKey, CellSource]]
         | Mapping[ColumnKey, Sequence[CellSource]],
     ) -> TableNode:
         column_order = self._columns
@@ -257,7 +259,9 @@ class TableBuilder(_BuilderBase):
                 column_order=column_order,
             )
         else:
-            tupled_rows = _as_tuple(rows)
+            # Generators are consumed exactly once here, so callers can stream
+            # records without building an intermediate list themselves.
+            tupled_rows = tuple(rows) if isinstance(rows, Iterator) else _as_tuple(rows)
             if tupled_rows and all(isinstance(item, Mapping) for item in tupled_rows):
                 typed_records = cast(
                     tuple[Mapping[ColumnKey, CellSource], ...], tupled_rows
@@ -269,8 +273,66 @@ class TableBuilder(_BuilderBase):
                 )
             else:
                 row_nodes = tuple(_coerce_row(row) for row in tupled_rows)
+                if column_order and not any(
+                    isinstance(row, RowNode) for row in tupled_rows
+                ):
+                    # Positional rows carry no keys, so column_order names
+                    # the header directly (records as plain tuples). Prebuilt
+                    # RowNodes already describe their own layout.
+                    for row_node in row_nodes:
+                        if len(row_node.cells) != len(column_order):
+                            msg = (
+                                f"Row has {len(row_node.cells)} cells but "
+                                f"column_order names {len(column_order)} columns"
+                            )
+                            raise ValueError(msg)
+                    derived_header = _coerce_row(
+                        column_order, extra_styles=self._header_styles
+                    )
+
+        # An empty body has nothing to style, whatever the column names.
+        column_styles = (
+            _column_styles_by_position(
+                self._column_styles,
+                header=derived_header,
+                column_order=column_order,
+            )
+            if row_nodes
+            else ()
+        )
+        return TableNode(
+            rows=row_nodes,
+            styles=self._styles,
+            header=derived_header,
+            column_styles=column_styles,
+        )
 
-        return TableNode(rows=row_nodes, styles=self._styles, header=derived_header)
+
+def _column_styles_by_position(
+    column_styles: Mapping[ColumnKey, tuple[Style, ...]],
+    *,
+    header: RowNode | None,
+    column_order: Sequence[ColumnKey] | None,
+) -> tuple[tuple[Style, ...], ...]:
+    if not column_styles:
+        return ()
+    if header is not None:
+        names = [cell.value for cell in header.cells]
+    elif column_order:
+        names = list(column_order)
+    else:
+        msg = "column_styles requires column_order or keyed rows"
+        raise ValueError(msg)
+    unknown = [key for key in column_styles if key not in names]
+    if unknown:
+        msg = f"column_styles names unknown table columns: {unknown!r}"
+        raise ValueError(msg)
+    positions = {name: index for index, name in enumerate(names)}
+    width = max(positions[key] for key in column_styles) + 1
+    by_position: list[tuple[Style, ...]] = [()] * width
+    for key, styles in column_styles.items():
+        by_position[positions[key]] = styles
+    return tuple(by_position)
 
 
 class SheetBuilder:
@@ -359,8 +421,14 @@ def table(
     style: Sequence[Style] | None = None,
     header_style: Sequence[Style] | None = None,
     column_order: Sequence[ColumnKey] | None = None,
+    column_styles: Mapping[ColumnKey, Sequence[Style]] | None = None,
 ) -> TableBuilder:
-    return TableBuilder(styles=style, header_style=header_style, columns=column_order)
+    return TableBuilder(
+        styles=style,
+        header_style=header_style,
+        columns=column_order,
+        column_styles=column_styles,
+    )
 
 
 def sheet(
@@ -377,13 +445,17 @@ def sheet(
 
 
 def import_sheet(
-    source: str | Path | bytes | BinaryIO,
+    source: str | Path | bytes | BinaryIO | OpenpyxlWorkbook,
     sheet_name: str,
     *,
     name: str | None = None,
     show_gridlines: bool | None = None,
 ) -> ImportedSheetNode:
-    """Import an existing sheet from a workbook without translating it."""
+    """Import an existing sheet from a workbook without translating it.
+
+    ``source`` may also be an already loaded openpyxl ``Workbook``, which is
+    read in place instead of being parsed again.
+    """
 
     dest_name = name or sheet_name
     _validate_sheet_name(dest_name)
@@ -410,7 +482,15 @@ def vstack(
     if gap < 0:
         raise ValueError("Vertical stack gap must be >= 0")
     components = tuple(_ensure_component(item) for item in items)
-    return VerticalStackNode(items=components, gap=gap, styles=tuple(style or ()))
+    styles = tuple(style or ())
+    if len(components) == 1 and isinstance(components[0], VerticalStackNode):
+        # A lone same-axis child lays out identically once hoisted; fold it
+        # so the renderer walks one level fewer. Outer styles stay first.
+        inner = components[0]
+        return VerticalStackNode(
+            items=inner.items, gap=inner.gap, styles=styles + inner.styles
+        )
+    return VerticalStackNode(items=components, gap=gap, styles=styles)
 
 
 def hstack(
@@ -421,7 +501,15 @@ def hstack(
     if gap < 0:
         raise ValueError("Horizontal stack gap must be >= 0")
     components = tuple(_ensure_component(item) for item in items)
-    return HorizontalStackNode(items=components, gap=gap, styles=tuple(style or ()))
+    styles = tuple(style or ())
+    if len(components) == 1 and isinstance(components[0], HorizontalStackNode):
+        # A lone same-axis child lays out identically once hoisted; fold it
+        # so the renderer walks one level fewer. Outer styles stay first.
+        inner = components[0]
+        return HorizontalStackNode(
+            items=inner.items, gap=inner.gap, styles=styles + inner.styles
+        )
+    return HorizontalStackNode(items=components, gap=gap, styles=styles)
 
 
 def workbook() -> WorkbookBuilder:
@@ -7,12 +7,24 @@ from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator
+
+from openpyxl.cell.cell import Cell
+
+from ..styles import cached_field_hash, state_without_cached_hash
 
 if TYPE_CHECKING:
+    from openpyxl import Workbook as OpenpyxlWorkbook
+
     from ..styles import BorderStyleName
 
-__all__ = ["Engine", "EffectiveStyle", "SaveTarget", "normalize_cell_value"]
+__all__ = [
+    "Engine",
+    "EffectiveStyle",
+    "SaveTarget",
+    "iter_source_cells",
+    "normalize_cell_value",
+]
 
 
 @dataclass(frozen=True)
@@ -45,6 +57,13 @@ class EffectiveStyle:
     border_left: bool
     border_right: bool
 
+    def __hash__(self) -> int:
+        # Engines key their style caches by the resolved style of every cell.
+        return cached_field_hash(self)
+
+    def __getstate__(self) -> dict[str, object]:
+        return state_without_cached_hash(self)
+
 
 SaveTarget = str | Path | BinaryIO
 
@@ -65,6 +84,34 @@ def normalize_cell_value(value: object) -> object:
     return str(value)
 
 
+def iter_source_cells(
+    worksheet: Any, *, include: Iterable[tuple[int, int]] = ()
+) -> Iterator[Any]:
+    """Yield the cells of an imported worksheet in row-major order.
+
+    ``iter_rows()`` on a regular worksheet materializes a blank cell at every
+    position of the used range, which would mutate a source workbook the
+    caller still owns, so only the cells the sheet already holds are walked.
+    Read-only worksheets keep no cell map and stream their rows instead.
+    Positions in ``include`` with no cell (e.g. merge anchors) are yielded as
+    detached blank cells.
+    """
+    cells = getattr(worksheet, "_cells", None)
+    if cells is None:
+        # Streamed rows pad gaps with coordinate-less empty cells; skip them.
+        cells = {
+            (cell.row, cell.column): cell
+            for row in worksheet.iter_rows()
+            for cell in row
+            if getattr(cell, "row", None) is not None
+        }
+    for coordinate in sorted(cells.keys() | set(include)):
+        cell = cells.get(coordinate)
+        if cell is None:
+            cell = Cell(worksheet, row=coordinate[0], column=coordinate[1])
+        yield cell
+
+
 class Engine(ABC):
     """Abstract base class for Excel rendering engines.
 
@@ -169,7 +216,7 @@ class Engine(ABC):
     @abstractmethod
     def copy_sheet(
         self,
-        source: SaveTarget | bytes | BinaryIO,
+        source: SaveTarget | bytes | BinaryIO | OpenpyxlWorkbook,
         sheet_name: str,
         dest_name: str,
         show_gridlines: bool | None = None,
@@ -177,7 +224,8 @@ class Engine(ABC):
         """Copy an existing sheet from another workbook into this workbook.
 
         Args:
-            source: Path, file-like, or bytes of the source workbook.
+            source: Path, file-like, or bytes of the source workbook, or an
+                already loaded openpyxl Workbook.
             sheet_name: Name of the sheet within the source workbook to copy.
             dest_name: Name of the sheet to create in the destination workbook.
             show_gridlines: Override gridline visibility. When None, preserve the
@@ -9,11 +9,18 @@ from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
+from openpyxl import Workbook as OpenpyxlWorkbook
 from openpyxl import load_workbook
 from openpyxl.cell.cell import MergedCell
 
 from ..styles import BorderStyleName, normalize_hex
-from .base import EffectiveStyle, Engine, SaveTarget, normalize_cell_value
+from .base import (
+    EffectiveStyle,
+    Engine,
+    SaveTarget,
+    iter_source_cells,
+    normalize_cell_value,
+)
 
 __all__ = ["HtmlEngine"]
 
@@ -122,7 +129,7 @@ class HtmlEngine(Engine):
 
     def copy_sheet(
         self,
-        source: SaveTarget | bytes | BinaryIO,
+        source: SaveTarget | bytes | BinaryIO | OpenpyxlWorkbook,
         sheet_name: str,
         dest_name: str,
         show_gridlines: bool | None = None,
@@ -132,7 +139,9 @@ class HtmlEngine(Engine):
             raise ValueError(f"Sheet '{sheet_name}' not found in source workbook")
         source_ws = source_wb[sheet_name]
 
-        source_gridlines = source_ws.sheet_view.showGridLines
+        # Read-only sources load no sheet view, merges or dimensions.
+        source_view = getattr(source_ws, "sheet_view", None)
+        source_gridlines = None if source_view is None else source_view.showGridLines
         self.create_sheet(
             dest_name,
             show_gridlines=(True if source_gridlines is None else source_gridlines)
@@ -142,7 +151,8 @@ class HtmlEngine(Engine):
         sheet = self._require_sheet()
         merge_anchors: set[tuple[int, int]] = set()
 
-        for merged_range in source_ws.merged_cells.ranges:
+        merged_cells = getattr(source_ws, "merged_cells", None)
+        for merged_range in merged_cells.ranges if merged_cells else ():
             min_col, min_row, max_col, max_row = merged_range.bounds
             sheet.merges[(min_row, min_col)] = (
                 max_row - min_row + 1,
@@ -157,31 +167,30 @@ class HtmlEngine(Engine):
             sheet.max_row = max(sheet.max_row, max_row)
             sheet.max_col = max(sheet.max_col, max_col)
 
-        for row in source_ws.iter_rows():
-            for cell in row:
-                if isinstance(cell, MergedCell):
-                    continue
-                if cell.value is None and not getattr(cell, "has_style", False):
-                    if (cell.row, cell.column) not in merge_anchors:
-                        continue
-                if cell.row is None or cell.column is None:
+        for cell in iter_source_cells(source_ws, include=merge_anchors):
+            if isinstance(cell, MergedCell):
+                continue
+            if cell.value is None and not getattr(cell, "has_style", False):
+                if (cell.row, cell.column) not in merge_anchors:
                     continue
-                effective = self._openpyxl_cell_to_effective_style(cell)
-                sheet.cells[(cell.row, cell.column)] = _CellData(
-                    value=cell.value,
-                    style=effective,
-                    border_fallback_color=DEFAULT_BORDER_COLOR,
-                )
-                sheet.max_row = max(sheet.max_row, cell.row)
-                sheet.max_col = max(sheet.max_col, cell.column)
+            if cell.row is None or cell.column is None:
+                continue
+            effective = self._openpyxl_cell_to_effective_style(cell)
+            sheet.cells[(cell.row, cell.column)] = _CellData(
+                value=cell.value,
+                style=effective,
+                border_fallback_color=DEFAULT_BORDER_COLOR,
+            )
+            sheet.max_row = max(sheet.max_row, cell.row)
+            sheet.max_col = max(sheet.max_col, cell.column)
 
-        for col_letter, dim in source_ws.column_dimensions.items():
+        for col_letter, dim in getattr(source_ws, "column_dimensions", {}).items():
             if dim.width:
                 col_idx = _column_letter_to_index(col_letter)
                 sheet.col_widths[col_idx] = dim.width
                 sheet.max_col = max(sheet.max_col, col_idx)
 
-        for row_idx, dim in source_ws.row_dimensions.items():
+        for row_idx, dim in getattr(source_ws, "row_dimensions", {}).items():
             if dim.height:
                 sheet.row_heights[row_idx] = dim.height
                 sheet.max_row = max(sheet.max_row, row_idx)
@@ -488,7 +497,11 @@ class HtmlEngine(Engine):
             raise RuntimeError("No sheet created. Call create_sheet() first.")
         return self._current_sheet
 
-    def _load_source_workbook(self, source: SaveTarget | bytes | BinaryIO):
+    def _load_source_workbook(
+        self, source: SaveTarget | bytes | BinaryIO | OpenpyxlWorkbook
+    ):
+        if isinstance(source, OpenpyxlWorkbook):
+            return source
         if isinstance(source, (str, Path)):
             return load_workbook(filename=source, data_only=False)
         if isinstance(source, bytes):
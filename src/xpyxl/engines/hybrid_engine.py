@@ -6,7 +6,6 @@ for importing existing sheets and performing the final save.
 
 from __future__ import annotations
 
-from io import BytesIO
 from typing import BinaryIO
 
 from openpyxl import Workbook as _OpenpyxlWorkbook
@@ -36,7 +35,12 @@ class HybridEngine(Engine):
         self._xlsx_engine = XlsxWriterEngine()
         # Deferred import operations: (source, source_sheet_name, dest_name, show_gridlines)
         self._imports: list[
-            tuple[SaveTarget | bytes | BinaryIO, str, str, bool | None]
+            tuple[
+                SaveTarget | bytes | BinaryIO | _OpenpyxlWorkbook,
+                str,
+                str,
+                bool | None,
+            ]
         ] = []
         # Track sheet names in declaration order for reordering
         self._sheet_order: list[str] = []
@@ -100,7 +104,7 @@ class HybridEngine(Engine):
 
     def copy_sheet(
         self,
-        source: SaveTarget | bytes | BinaryIO,
+        source: SaveTarget | bytes | BinaryIO | _OpenpyxlWorkbook,
         sheet_name: str,
         dest_name: str,
         show_gridlines: bool | None = None,
@@ -116,17 +120,16 @@ class HybridEngine(Engine):
     def _build_openpyxl_workbook_from_xlsx(self) -> _OpenpyxlWorkbook:
         """Build the base openpyxl workbook from xlsxwriter output.
 
-        If there are generated sheets, saves xlsxwriter to bytes and loads
-        them with openpyxl. If there are no generated sheets, creates an
+        If there are generated sheets, loads xlsxwriter's in-memory output
+        straight into openpyxl. If there are no generated sheets, creates an
         empty openpyxl workbook.
         """
         if self._has_generated_sheets:
-            xlsx_bytes = self._xlsx_engine.save(None)
-            assert xlsx_bytes is not None
+            # Generated cells are always plain strings, so skip openpyxl's
+            # slower rich-text parse of the shared strings.
             return _load_workbook(
-                BytesIO(xlsx_bytes),
+                self._xlsx_engine.save_to_buffer(),
                 data_only=False,
-                rich_text=True,
             )
         else:
             # No generated sheets, create empty workbook
@@ -143,31 +146,16 @@ class HybridEngine(Engine):
         in the workbook definition, regardless of whether they are generated
         or imported.
         """
-        expected_order = self._sheet_order
+        rank = {title: i for i, title in enumerate(self._sheet_order)}
+        unranked = len(rank)
 
         # Access internal _sheets list (openpyxl doesn't expose a public reorder API).
         # Reorder in-place rather than replacing the list, to avoid breaking internal
-        # workbook invariants that Excel is sensitive to.
+        # workbook invariants that Excel is sensitive to. The sort is stable, so
+        # sheets missing from the declaration order keep their relative order
+        # after the declared ones.
         sheets = workbook._sheets  # type: ignore[attr-defined]
-        title_to_index = {ws.title: i for i, ws in enumerate(sheets)}
-
-        insert_at = 0
-        for title in expected_order:
-            idx = title_to_index.get(title)
-            if idx is None:
-                continue
-
-            if idx != insert_at:
-                ws = sheets.pop(idx)
-                sheets.insert(insert_at, ws)
-
-                # Update indices for the moved slice.
-                start = min(insert_at, idx)
-                end = max(insert_at, idx)
-                for j in range(start, end + 1):
-                    title_to_index[sheets[j].title] = j
-
-            insert_at += 1
+        sheets[:] = sorted(sheets, key=lambda ws: rank.get(ws.title, unranked))
 
         # Ensure the active sheet index is valid after reordering.
         try:
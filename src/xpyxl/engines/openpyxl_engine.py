@@ -3,23 +3,38 @@
 from __future__ import annotations
 
 import copy
+from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
 
 from openpyxl import Workbook, load_workbook
-from openpyxl.cell.cell import MergedCell
+from openpyxl.cell.cell import Cell, MergedCell
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE, BUILTIN_FORMATS_REVERSE
 from openpyxl.utils import get_column_letter
 
 from ..styles import to_argb
-from .base import EffectiveStyle, Engine, SaveTarget, normalize_cell_value
+from .base import (
+    EffectiveStyle,
+    Engine,
+    SaveTarget,
+    iter_source_cells,
+    normalize_cell_value,
+)
 
 if TYPE_CHECKING:
     from openpyxl.worksheet.worksheet import Worksheet
 
 __all__ = ["OpenpyxlEngine"]
 
+# Both conversions are pure, so cache them once per process rather than per
+# engine: every save reuses the same handful of colors and column indices.
+_argb = lru_cache(maxsize=512)(to_argb)
+_column_letter = lru_cache(maxsize=16384)(get_column_letter)
+
 
 def _set_cell_value(cell: Any, value: object) -> None:
     """Assign a cell value, normalizing for cross-engine consistency.
@@ -34,6 +49,48 @@ def _set_cell_value(cell: Any, value: object) -> None:
         cell.value = str(normalized)
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedStyleBundle:
+    """Workbook style indices registered for one resolved style.
+
+    An index is None when the style leaves that part of the cell untouched.
+    """
+
+    font_id: int
+    fill_id: int | None
+    alignment_id: int | None
+    border_id: int | None
+    number_format_id: int | None
+    # What a cell without any style of its own ends up with.
+    style_array: StyleArray
+
+
+# Common, non-style dimension attributes; workbook-scoped style internals are
+# deliberately left out when copying dimensions across workbooks.
+_DIMENSION_ATTRS = (
+    "width",
+    "height",
+    "hidden",
+    "outlineLevel",
+    "collapsed",
+    "bestFit",
+    "customWidth",
+    "customHeight",
+)
+
+
+def _copy_dimension_attrs(source_dim: object, dest_dim: object) -> None:
+    """Copy the set attributes of a row/column dimension onto another one."""
+    for attr in _DIMENSION_ATTRS:
+        value = getattr(source_dim, attr, None)
+        if value is None:
+            continue
+        try:
+            setattr(dest_dim, attr, value)
+        except Exception:
+            pass
+
+
 class OpenpyxlEngine(Engine):
     """Rendering engine using openpyxl."""
 
@@ -49,12 +106,15 @@ class OpenpyxlEngine(Engine):
     def _init_instance_vars(self) -> None:
         """Initialize common instance variables used by both __init__ and from_workbook."""
         self._current_sheet: Worksheet | None = None
-        # Cache style objects to avoid duplicates
-        self._style_cache: dict[tuple[Any, ...], dict[str, Any]] = {}
-        # Cache color conversions
-        self._color_cache: dict[str, str] = {}
-        # Cache column letters
-        self._column_letter_cache: dict[int, str] = {}
+        # Registered style indices per resolved style, so equal styles reuse
+        # one bundle instead of registering their Font/Fill/Border again.
+        self._style_cache: dict[
+            tuple[EffectiveStyle, str | None], _CachedStyleBundle
+        ] = {}
+        # Bundle from the previous lookup, so a run of identically styled cells
+        # skips the cache. It holds the style object itself rather than its
+        # id(), which could be reused once that style is freed.
+        self._last_styles: tuple[EffectiveStyle, str, _CachedStyleBundle] | None = None
         # Cache source workbooks (per engine instance, i.e. per save) so
         # importing several sheets from one file parses it only once
         self._source_workbook_cache: dict[str, Workbook] = {}
@@ -88,8 +148,19 @@ class OpenpyxlEngine(Engine):
         if self._current_sheet is None:
             raise RuntimeError("No sheet created. Call create_sheet() first.")
 
-        cell = self._current_sheet.cell(row=row, column=col)
-        _set_cell_value(cell, value)
+        # Same lookup-or-create as ws.cell(). Its bounds check only matters
+        # when a cell is created; anything already in _cells passed it.
+        sheet = self._current_sheet
+        cell = sheet._cells.get((row, col))  # type: ignore[attr-defined]
+        if cell is None:
+            if row < 1 or col < 1:
+                raise ValueError("Row or column values must be at least 1")
+            cell = Cell(sheet, row=row, column=col)
+            sheet._add_cell(cell)  # type: ignore[attr-defined]
+        # Blank cells are common in sparse tables; a fresh cell already holds
+        # None, so skip the value binding round-trip for them.
+        if value is not None or cell.value is not None:
+            _set_cell_value(cell, value)
         self._apply_style(cell, style, border_fallback_color)
 
     def write_merged_cell(
@@ -119,45 +190,30 @@ class OpenpyxlEngine(Engine):
             end_column=col + colspan - 1,
         )
 
-    def _get_cached_color(self, color: str) -> str:
-        """Get cached ARGB color or convert and cache it."""
-        if color not in self._color_cache:
-            self._color_cache[color] = to_argb(color)
-        return self._color_cache[color]
-
     def _get_cached_styles(
         self, effective: EffectiveStyle, border_fallback_color: str
-    ) -> dict[str, Any]:
+    ) -> _CachedStyleBundle:
         """Get or create cached style objects for the given style."""
-        # Create a hashable key from style properties
+        last = self._last_styles
+        if (
+            last is not None
+            and last[0] is effective
+            and last[1] == border_fallback_color
+        ):
+            return last[2]
+
+        # Unbordered styles ignore the fallback color; keep it out of their key.
         cache_key = (
-            effective.font_name,
-            effective.font_size,
-            effective.bold,
-            effective.italic,
-            effective.text_color,
-            effective.fill_color,
-            effective.horizontal_align,
-            effective.vertical_align,
-            effective.indent,
-            effective.wrap_text,
-            effective.shrink_to_fit,
-            effective.number_format,
-            effective.border,
-            effective.border_color or border_fallback_color
-            if effective.border
-            else None,
-            effective.border_top,
-            effective.border_bottom,
-            effective.border_left,
-            effective.border_right,
+            effective,
+            border_fallback_color if effective.border else None,
         )
-
-        if cache_key in self._style_cache:
-            return self._style_cache[cache_key]
+        cached = self._style_cache.get(cache_key)
+        if cached is not None:
+            self._last_styles = (effective, border_fallback_color, cached)
+            return cached
 
         # Create style objects
-        text_color_argb = self._get_cached_color(effective.text_color)
+        text_color_argb = _argb(effective.text_color)
         font = Font(
             name=effective.font_name,
             size=effective.font_size,
@@ -168,7 +224,7 @@ class OpenpyxlEngine(Engine):
 
         fill: PatternFill | None = None
         if effective.fill_color:
-            fill_color_argb = self._get_cached_color(effective.fill_color)
+            fill_color_argb = _argb(effective.fill_color)
             fill = PatternFill(
                 fill_type="solid",
                 start_color=fill_color_argb,
@@ -190,16 +246,11 @@ class OpenpyxlEngine(Engine):
         if align_kwargs:
             align_kwargs.setdefault("vertical", "bottom")
             alignment = Alignment(**align_kwargs)  # type: ignore[arg-type]
-        elif effective.wrap_text or effective.shrink_to_fit:
-            alignment = Alignment(
-                wrap_text=True if effective.wrap_text else None,
-                shrink_to_fit=True if effective.shrink_to_fit else None,
-            )
 
         border: Border | None = None
         if effective.border:
             border_color = effective.border_color or border_fallback_color
-            border_color_argb = self._get_cached_color(border_color)
+            border_color_argb = _argb(border_color)
 
             def build_side(enabled: bool) -> Side | None:
                 if not enabled:
@@ -223,15 +274,45 @@ class OpenpyxlEngine(Engine):
                 side = build_side(True)
                 border = Border(left=side, right=side, top=side, bottom=side)
 
-        styles = {
-            "font": font,
-            "fill": fill,
-            "alignment": alignment,
-            "border": border,
-            "number_format": effective.number_format,
-        }
+        # Register each style object with the workbook once and keep only the
+        # resulting indices: the cell descriptors would otherwise hash and
+        # look up the same Font/Fill/Border in the workbook on every cell.
+        workbook: Any = self._workbook
+        font_id = workbook._fonts.add(font)
+        fill_id = None if fill is None else workbook._fills.add(fill)
+        alignment_id = None if alignment is None else workbook._alignments.add(alignment)
+        border_id = None if border is None else workbook._borders.add(border)
+        number_format_id: int | None = None
+        if effective.number_format:
+            number_format_id = BUILTIN_FORMATS_REVERSE.get(effective.number_format)
+            if number_format_id is None:
+                number_format_id = (
+                    workbook._number_formats.add(effective.number_format)
+                    + BUILTIN_FORMATS_MAX_SIZE
+                )
+
+        style_array = StyleArray()
+        style_array.fontId = font_id
+        if fill_id is not None:
+            style_array.fillId = fill_id
+        if alignment_id is not None:
+            style_array.alignmentId = alignment_id
+        if border_id is not None:
+            style_array.borderId = border_id
+        if number_format_id is not None:
+            style_array.numFmtId = number_format_id
+
+        styles = _CachedStyleBundle(
+            font_id=font_id,
+            fill_id=fill_id,
+            alignment_id=alignment_id,
+            border_id=border_id,
+            number_format_id=number_format_id,
+            style_array=style_array,
+        )
 
         self._style_cache[cache_key] = styles
+        self._last_styles = (effective, border_fallback_color, styles)
         return styles
 
     def _apply_style(
@@ -240,35 +321,30 @@ class OpenpyxlEngine(Engine):
         """Apply style to an openpyxl cell."""
         styles = self._get_cached_styles(effective, border_fallback_color)
 
-        cell.font = styles["font"]  # type: ignore[attr-defined]
-
-        if styles["fill"]:
-            cell.fill = styles["fill"]  # type: ignore[attr-defined]
-
-        if styles["alignment"]:
-            cell.alignment = styles["alignment"]  # type: ignore[attr-defined]
-        elif cell.alignment is None and (  # type: ignore[attr-defined]
-            effective.wrap_text or effective.shrink_to_fit
-        ):
-            # Handle edge case where alignment wasn't cached but wrap/shrink is needed
-            cell.alignment = Alignment(  # type: ignore[attr-defined]
-                wrap_text=True if effective.wrap_text else None,
-                shrink_to_fit=True if effective.shrink_to_fit else None,
-            )
-
-        if styles["number_format"]:
-            cell.number_format = styles["number_format"]  # type: ignore[attr-defined]
+        # A cell with no style yet (no background fill, no date format set
+        # from its value) takes the precomputed StyleArray wholesale.
+        if not cell.has_style:  # type: ignore[attr-defined]
+            cell._style = copy.copy(styles.style_array)  # type: ignore[attr-defined]
+            return
 
-        if styles["border"]:
-            cell.border = styles["border"]  # type: ignore[attr-defined]
+        # Otherwise layer this style's indices over the existing ones, exactly
+        # as the font/fill/alignment/number_format/border setters would.
+        style_array = cell._style  # type: ignore[attr-defined]
+        style_array.fontId = styles.font_id
+        if styles.fill_id is not None:
+            style_array.fillId = styles.fill_id
+        if styles.alignment_id is not None:
+            style_array.alignmentId = styles.alignment_id
+        if styles.number_format_id is not None:
+            style_array.numFmtId = styles.number_format_id
+        if styles.border_id is not None:
+            style_array.borderId = styles.border_id
 
     def set_column_width(self, col: int, width: float) -> None:
         if self._current_sheet is None:
             raise RuntimeError("No sheet created. Call create_sheet() first.")
 
-        if col not in self._column_letter_cache:
-            self._column_letter_cache[col] = get_column_letter(col)
-        letter = self._column_letter_cache[col]
+        letter = _column_letter(col)
         self._current_sheet.column_dimensions[letter].width = max(width, 8.0)
 
     def set_row_height(self, row: int, height: float) -> None:
@@ -286,16 +362,23 @@ class OpenpyxlEngine(Engine):
         if self._current_sheet is None:
             raise RuntimeError("No sheet created. Call create_sheet() first.")
 
-        fill_color = self._get_cached_color(color)
+        fill_color = _argb(color)
         sheet_fill = PatternFill(
             fill_type="solid", start_color=fill_color, end_color=fill_color
         )
-        # Reuse the same PatternFill object for all cells (openpyxl supports this)
+        # Register the fill once and write its index straight into each cell's
+        # StyleArray; `cell.fill = ...` would re-hash the fill for every cell.
+        workbook: Any = self._workbook
+        fill_id = workbook._fills.add(sheet_fill)
         for row in self._current_sheet.iter_rows(
             min_row=1, max_row=max_row, min_col=1, max_col=max_col
         ):
             for cell in row:
-                cell.fill = sheet_fill
+                style_array = cell._style  # type: ignore[attr-defined]
+                if style_array is None:
+                    # Cells openpyxl creates on demand have no StyleArray yet.
+                    style_array = cell._style = StyleArray()  # type: ignore[attr-defined]
+                style_array.fillId = fill_id
 
     def _ensure_named_styles(self, source_wb: Workbook) -> None:
         """Ensure named styles used by imported sheets exist in the destination workbook."""
@@ -354,26 +437,42 @@ class OpenpyxlEngine(Engine):
             target_ws.freeze_panes = source_ws.freeze_panes
         except Exception:
             pass
-        try:
-            target_ws.auto_filter.ref = source_ws.auto_filter.ref
-        except Exception:
-            pass
-        try:
-            target_ws.sheet_view.zoomScale = source_ws.sheet_view.zoomScale
-        except Exception:
-            pass
-
-        # Values (including formulas) + cell-level style objects.
-        for row in source_ws.iter_rows():
-            for cell in row:
-                if isinstance(cell, MergedCell):
-                    continue
-                if cell.row is None or cell.column is None:
-                    continue
-                target_cell = target_ws.cell(
-                    row=cell.row, column=cell.column, value=cell.value
-                )
-                if getattr(cell, "has_style", False):
+        # Both values were validated when the source was loaded, so only
+        # copy them when they are actually set. Read-only sources load
+        # neither the filter nor the sheet view.
+        auto_filter = getattr(source_ws, "auto_filter", None)
+        auto_filter_ref = getattr(auto_filter, "ref", None)
+        if auto_filter_ref:
+            target_ws.auto_filter.ref = auto_filter_ref
+        zoom_scale = getattr(getattr(source_ws, "sheet_view", None), "zoomScale", None)
+        if zoom_scale:
+            target_ws.sheet_view.zoomScale = zoom_scale
+
+        # Values (including formulas) + cell-level style objects. Cells that
+        # share a source StyleArray resolve to the same destination indices, so
+        # the style objects are copied once per distinct source style.
+        style_map: dict[tuple[int, ...], Any] = {}
+        for cell in iter_source_cells(source_ws):
+            if isinstance(cell, MergedCell):
+                continue
+            if cell.row is None or cell.column is None:
+                continue
+            # The target sheet is freshly created, so build cells directly
+            # instead of going through the validating ws.cell() lookup.
+            target_cell = Cell(
+                target_ws, row=cell.row, column=cell.column, value=cell.value
+            )
+            target_ws._add_cell(target_cell)  # type: ignore[attr-defined]
+            if getattr(cell, "has_style", False):
+                # Read-only cells expose their StyleArray as style_array.
+                source_style = getattr(cell, "style_array", None)
+                if source_style is None:
+                    source_style = cell._style  # type: ignore[attr-defined]
+                key = tuple(source_style)
+                mapped = style_map.get(key)
+                if mapped is not None:
+                    target_cell._style = copy.copy(mapped)  # type: ignore[attr-defined]
+                else:
                     # Copy resolved style objects, not style indices.
                     target_cell.font = copy.copy(cell.font)  # pyright: ignore[reportAttributeAccessIssue]
                     target_cell.fill = copy.copy(cell.fill)  # pyright: ignore[reportAttributeAccessIssue]
@@ -381,13 +480,16 @@ class OpenpyxlEngine(Engine):
                     target_cell.alignment = copy.copy(cell.alignment)  # pyright: ignore[reportAttributeAccessIssue]
                     target_cell.number_format = cell.number_format
                     target_cell.protection = copy.copy(cell.protection)  # pyright: ignore[reportAttributeAccessIssue]
-                if getattr(cell, "hyperlink", None):
-                    target_cell._hyperlink = copy.copy(cell._hyperlink)  # type: ignore[attr-defined]
-                if cell.comment:
-                    target_cell.comment = copy.copy(cell.comment)
+                    style_map[key] = copy.copy(target_cell._style)  # type: ignore[attr-defined]
+            if getattr(cell, "hyperlink", None):
+                target_cell._hyperlink = copy.copy(cell._hyperlink)  # type: ignore[attr-defined]
+            comment = getattr(cell, "comment", None)
+            if comment:
+                target_cell.comment = copy.copy(comment)
 
         # Merge ranges
-        for merged_range in source_ws.merged_cells.ranges:
+        merged_cells = getattr(source_ws, "merged_cells", None)
+        for merged_range in merged_cells.ranges if merged_cells else ():
             target_ws.merge_cells(str(merged_range))
 
         # Data validations
@@ -410,30 +512,10 @@ class OpenpyxlEngine(Engine):
         except Exception:
             pass
 
-        def _copy_dimension_attrs(source_dim: object, dest_dim: object) -> None:
-            # Copy common, non-style attributes; skip workbook-scoped style internals.
-            for attr in (
-                "width",
-                "height",
-                "hidden",
-                "outlineLevel",
-                "collapsed",
-                "bestFit",
-                "customWidth",
-                "customHeight",
-            ):
-                try:
-                    if hasattr(source_dim, attr):
-                        value = getattr(source_dim, attr)
-                        if value is not None:
-                            setattr(dest_dim, attr, value)
-                except Exception:
-                    pass
-
-        for column, dimension in source_ws.column_dimensions.items():
+        for column, dimension in getattr(source_ws, "column_dimensions", {}).items():
             _copy_dimension_attrs(dimension, target_ws.column_dimensions[column])
 
-        for row, dimension in source_ws.row_dimensions.items():
+        for row, dimension in getattr(source_ws, "row_dimensions", {}).items():
             _copy_dimension_attrs(dimension, target_ws.row_dimensions[row])
 
         # Excel tables (best-effort). Table names are workbook-global and
@@ -595,7 +677,12 @@ class OpenpyxlEngine(Engine):
                 if y_num_ref and hasattr(y_num_ref, "f"):
                     y_num_ref.f = update_ref(y_num_ref.f)
 
-    def _load_source_workbook(self, source: SaveTarget | bytes | BinaryIO) -> Workbook:
+    def _load_source_workbook(
+        self, source: SaveTarget | bytes | BinaryIO | Workbook
+    ) -> Workbook:
+        if isinstance(source, Workbook):
+            # Already parsed; cloning only reads from it.
+            return source
         if isinstance(source, (str, Path)):
             key = str(source)
             cached = self._source_workbook_cache.get(key)
@@ -629,7 +716,7 @@ class OpenpyxlEngine(Engine):
 
     def copy_sheet(
         self,
-        source: SaveTarget | bytes | BinaryIO,
+        source: SaveTarget | bytes | BinaryIO | Workbook,
         sheet_name: str,
         dest_name: str,
         show_gridlines: bool | None = None,
@@ -650,8 +737,9 @@ class OpenpyxlEngine(Engine):
         source_ws = source_wb[sheet_name]
         target_ws = self._workbook.create_sheet(title=dest_name)
         self._clone_sheet_contents(source_ws, target_ws)
+        source_view = getattr(source_ws, "sheet_view", None)
         target_ws.sheet_view.showGridLines = (
-            source_ws.sheet_view.showGridLines
+            (True if source_view is None else source_view.showGridLines)
             if show_gridlines is None
             else show_gridlines
         )
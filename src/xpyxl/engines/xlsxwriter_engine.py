@@ -6,7 +6,7 @@ from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 
 import xlsxwriter
 
@@ -14,6 +14,7 @@ from ..styles import normalize_hex
 from .base import EffectiveStyle, Engine, SaveTarget, normalize_cell_value
 
 if TYPE_CHECKING:
+    from openpyxl import Workbook as OpenpyxlWorkbook
     from xlsxwriter.format import Format
     from xlsxwriter.worksheet import Worksheet
 
@@ -55,8 +56,12 @@ class XlsxWriterEngine(Engine):
         workbook_options = {"in_memory": True, "nan_inf_to_errors": True}
         self._workbook = xlsxwriter.Workbook(self._buffer, workbook_options)
         self._current_sheet: Worksheet | None = None
-        # Cache format objects to avoid duplicates
-        self._format_cache: dict[tuple[Any, ...], Format] = {}
+        # One Format per resolved style (and border fallback color, for
+        # bordered styles), so equal styles share a single xf record.
+        self._format_cache: dict[tuple[EffectiveStyle, str | None], Format] = {}
+        # Table rows hand over the same EffectiveStyle object cell after cell;
+        # an identity check returns the previous Format without a dict lookup.
+        self._last_format: tuple[EffectiveStyle, str, Format] | None = None
         self._closed = False
 
     def create_sheet(self, name: str, show_gridlines: bool = True) -> None:
@@ -67,30 +72,16 @@ class XlsxWriterEngine(Engine):
         self, style: EffectiveStyle, border_fallback_color: str
     ) -> "Format":
         """Get or create a format object for the given style."""
-        # Create a hashable key from style properties
-        cache_key = (
-            style.font_name,
-            style.font_size,
-            style.bold,
-            style.italic,
-            style.text_color,
-            style.fill_color,
-            style.horizontal_align,
-            style.vertical_align,
-            style.indent,
-            style.wrap_text,
-            style.shrink_to_fit,
-            style.number_format,
-            style.border,
-            style.border_color or border_fallback_color if style.border else None,
-            style.border_top,
-            style.border_bottom,
-            style.border_left,
-            style.border_right,
-        )
+        last = self._last_format
+        if last is not None and last[0] is style and last[1] == border_fallback_color:
+            return last[2]
 
-        if cache_key in self._format_cache:
-            return self._format_cache[cache_key]
+        # Only bordered formats depend on the fallback color.
+        cache_key = (style, border_fallback_color if style.border else None)
+        fmt = self._format_cache.get(cache_key)
+        if fmt is not None:
+            self._last_format = (style, border_fallback_color, fmt)
+            return fmt
 
         fmt = self._workbook.add_format()
 
@@ -172,6 +163,7 @@ class XlsxWriterEngine(Engine):
                 fmt.set_border_color(border_color)
 
         self._format_cache[cache_key] = fmt
+        self._last_format = (style, border_fallback_color, fmt)
         return fmt
 
     def write_cell(
@@ -277,7 +269,7 @@ class XlsxWriterEngine(Engine):
 
     def copy_sheet(
         self,
-        source: SaveTarget | bytes | BinaryIO,
+        source: SaveTarget | bytes | BinaryIO | OpenpyxlWorkbook,
         sheet_name: str,
         dest_name: str,
         show_gridlines: bool | None = None,
@@ -288,11 +280,24 @@ class XlsxWriterEngine(Engine):
         )
         raise NotImplementedError(msg)
 
-    def save(self, target: SaveTarget | None = None) -> bytes | None:
+    def _close(self) -> None:
         if not self._closed:
             self._workbook.close()
             self._closed = True
 
+    def save_to_buffer(self) -> BytesIO:
+        """Finalize the workbook and return the in-memory buffer holding it.
+
+        The buffer is rewound and shared, not copied; callers that only read
+        it (e.g. openpyxl's load_workbook) avoid materializing the bytes again.
+        """
+        self._close()
+        self._buffer.seek(0)
+        return self._buffer
+
+    def save(self, target: SaveTarget | None = None) -> bytes | None:
+        self._close()
+
         data = self._buffer.getvalue()
         if target is None:
             return data
@@ -7,10 +7,17 @@ from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
+from openpyxl import Workbook as OpenpyxlWorkbook
 from openpyxl import load_workbook
 from openpyxl.cell.cell import MergedCell
 
-from ..engines.base import EffectiveStyle, Engine, SaveTarget, normalize_cell_value
+from ..engines.base import (
+    EffectiveStyle,
+    Engine,
+    SaveTarget,
+    iter_source_cells,
+    normalize_cell_value,
+)
 from ..nodes import WorkbookNode
 from ..render import render_sheet
 from ..styles import BorderStyleName, normalize_hex
@@ -121,7 +128,7 @@ class _LayoutEngine(Engine):
 
     def copy_sheet(
         self,
-        source: SaveTarget | bytes | BinaryIO,
+        source: SaveTarget | bytes | BinaryIO | OpenpyxlWorkbook,
         sheet_name: str,
         dest_name: str,
         show_gridlines: bool | None = None,
@@ -130,7 +137,8 @@ class _LayoutEngine(Engine):
         if sheet_name not in workbook.sheetnames:
             raise ValueError(f"Sheet '{sheet_name}' not found in source workbook")
         source_sheet = workbook[sheet_name]
-        source_gridlines = source_sheet.sheet_view.showGridLines
+        source_view = getattr(source_sheet, "sheet_view", None)
+        source_gridlines = None if source_view is None else source_view.showGridLines
         self.create_sheet(
             dest_name,
             show_gridlines=(True if source_gridlines is None else source_gridlines)
@@ -139,36 +147,37 @@ class _LayoutEngine(Engine):
         )
 
         merges: dict[tuple[int, int], tuple[int, int]] = {}
-        for merged_range in source_sheet.merged_cells.ranges:
+        merged_cells = getattr(source_sheet, "merged_cells", None)
+        for merged_range in merged_cells.ranges if merged_cells else ():
             min_col, min_row, max_col, max_row = merged_range.bounds
             rowspan = max_row - min_row + 1
             colspan = max_col - min_col + 1
             merges[(min_row, min_col)] = (rowspan, colspan)
 
-        for row in source_sheet.iter_rows():
-            for cell in row:
-                if isinstance(cell, MergedCell):
+        for cell in iter_source_cells(source_sheet, include=merges):
+            if isinstance(cell, MergedCell):
+                continue
+            if cell.value is None and not getattr(cell, "has_style", False):
+                if (cell.row, cell.column) not in merges:
                     continue
-                if cell.value is None and not getattr(cell, "has_style", False):
-                    if (cell.row, cell.column) not in merges:
-                        continue
-                rowspan, colspan = merges.get((cell.row, cell.column), (1, 1))
-                self._add_cell(
-                    cell.row,
-                    cell.column,
-                    rowspan,
-                    colspan,
-                    cell.value,
-                    _style_from_openpyxl_cell(cell),
-                    _DEFAULT_BORDER_COLOR,
-                )
-
-        for column_letter, dimension in source_sheet.column_dimensions.items():
+            rowspan, colspan = merges.get((cell.row, cell.column), (1, 1))
+            self._add_cell(
+                cell.row,
+                cell.column,
+                rowspan,
+                colspan,
+                cell.value,
+                _style_from_openpyxl_cell(cell),
+                _DEFAULT_BORDER_COLOR,
+            )
+
+        column_dimensions = getattr(source_sheet, "column_dimensions", {})
+        for column_letter, dimension in column_dimensions.items():
             if dimension.width:
                 self.set_column_width(
                     _column_letter_to_index(column_letter), float(dimension.width)
                 )
-        for row_index, dimension in source_sheet.row_dimensions.items():
+        for row_index, dimension in getattr(source_sheet, "row_dimensions", {}).items():
             if dimension.height:
                 self.set_row_height(row_index, float(dimension.height))
 
@@ -216,7 +225,9 @@ def build_workbook_layout(node: WorkbookNode) -> WorkbookLayout:
     return WorkbookLayout(tuple(engine.sheets))
 
 
-def _load_source_workbook(source: SaveTarget | bytes | BinaryIO):
+def _load_source_workbook(source: SaveTarget | bytes | BinaryIO | OpenpyxlWorkbook):
+    if isinstance(source, OpenpyxlWorkbook):
+        return source
     if isinstance(source, (str, Path)):
         return load_workbook(source, data_only=False)
     if isinstance(source, bytes):
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import BinaryIO, TypeAlias
+from typing import TYPE_CHECKING, BinaryIO, TypeAlias
 
 from .styles import Style
 
+if TYPE_CHECKING:
+    from openpyxl import Workbook as OpenpyxlWorkbook
+
 __all__ = [
     "CellNode",
     "RowNode",
@@ -25,7 +28,7 @@ __all__ = [
 CellValue: TypeAlias = object
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellNode:
     value: CellValue
     styles: tuple[Style, ...] = ()
@@ -33,39 +36,42 @@ class CellNode:
     rowspan: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RowNode:
     cells: tuple[CellNode, ...]
     styles: tuple[Style, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnNode:
     cells: tuple[CellNode, ...]
     styles: tuple[Style, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableNode:
     rows: tuple[RowNode, ...]
     styles: tuple[Style, ...] = ()
     header: RowNode | None = None
+    # Per-position body styles; shorter than the row width when trailing
+    # columns carry none.
+    column_styles: tuple[tuple[Style, ...], ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpacerNode:
     rows: int = 1
     height: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerticalStackNode:
     items: tuple["SheetComponent", ...]
     gap: int = 0
     styles: tuple[Style, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HorizontalStackNode:
     items: tuple["SheetComponent", ...]
     gap: int = 0
@@ -89,7 +95,7 @@ RenderableItem = CellNode | RowNode | ColumnNode | TableNode | SpacerNode
 SheetItem = SheetComponent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SheetNode:
     name: str
     items: tuple[SheetItem, ...]
@@ -97,16 +103,16 @@ class SheetNode:
     show_gridlines: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportedSheetNode:
     """Reference to an existing Excel sheet to be copied as-is."""
 
     name: str
-    source: str | Path | bytes | BinaryIO
+    source: str | Path | bytes | BinaryIO | OpenpyxlWorkbook
     source_sheet: str
     show_gridlines: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkbookNode:
     sheets: tuple[SheetNode | ImportedSheetNode, ...]
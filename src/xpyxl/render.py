@@ -50,7 +50,7 @@ DEFAULT_BACKGROUND_MIN_COLS = 80
 _Axis = Literal["vertical", "horizontal"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PlacedCell:
     row: int
     col: int
@@ -61,7 +61,7 @@ class _PlacedCell:
     prefer_height: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PlacedSpacer:
     row: int
     col: int
@@ -446,6 +446,7 @@ def _build_table_plan(node: TableNode, extra_styles: tuple[Style, ...]) -> _Grid
         extras: Sequence[Style] = (),
         prefer_height: float | None = None,
         extras_first: bool = False,
+        column_styles: Sequence[tuple[Style, ...]] = (),
     ) -> None:
         for column_offset, cell_node in enumerate(row_node.cells, start=1):
             base_chain = (*extra_styles, *node.styles)
@@ -457,10 +458,16 @@ def _build_table_plan(node: TableNode, extra_styles: tuple[Style, ...]) -> _Grid
                     *cell_node.styles,
                 )
             else:
+                column_chain = (
+                    column_styles[column_offset - 1]
+                    if column_offset <= len(column_styles)
+                    else ()
+                )
                 style_chain = (
                     *base_chain,
                     *row_node.styles,
                     *extras,
+                    *column_chain,
                     *cell_node.styles,
                 )
             if table_border_style:
@@ -491,7 +498,12 @@ def _build_table_plan(node: TableNode, extra_styles: tuple[Style, ...]) -> _Grid
         extras: list[Style] = []
         if stripe_style and idx % 2 == 1:
             extras.append(stripe_style)
-        add_row(row_node, extras=extras, prefer_height=compact_height)
+        add_row(
+            row_node,
+            extras=extras,
+            prefer_height=compact_height,
+            column_styles=node.column_styles,
+        )
         current_row += 1
 
     return plan
@@ -740,7 +752,10 @@ def render_sheet(engine: Engine, node: SheetNode | ImportedSheetNode) -> None:
         target_max_col = max(max_col, DEFAULT_BACKGROUND_MIN_COLS)
         engine.fill_background(background_fill, target_max_row, target_max_col)
 
-    for placement in sorted(plan.cells, key=lambda cell: (cell.row, cell.col)):
+    # Sort in place: the plan is private to this call, and a sorted() copy
+    # would hold a second list of every placed cell for large sheets.
+    plan.cells.sort(key=lambda cell: (cell.row, cell.col))
+    for placement in plan.cells:
         effective = _resolve(placement.styles)
         if background_fill is not None and effective.fill_color is None:
             # Keep the sheet background visible on populated cells too.
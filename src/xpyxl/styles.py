@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Literal, TypedDict, Unpack
+from dataclasses import dataclass, fields
+from typing import Any, Iterable, Literal, TypedDict, Unpack
 
 __all__ = [
     "Style",
@@ -127,6 +127,31 @@ def to_argb(value: str) -> str:
     return "FF" + rgb
 
 
+def cached_field_hash(instance: Any) -> int:
+    """Hash a frozen dataclass by its fields, computing it once per instance.
+
+    The value is stored in the instance ``__dict__``; pair this with
+    `state_without_cached_hash` so pickles and copies don't carry it.
+    """
+    cached = instance.__dict__.get("_hash")
+    if cached is None:
+        values = tuple(getattr(instance, field.name) for field in fields(instance))
+        cached = hash(values)
+        object.__setattr__(instance, "_hash", cached)
+    return cached
+
+
+def state_without_cached_hash(instance: Any) -> dict[str, object]:
+    """Return pickle/copy state without the hash cached by `cached_field_hash`.
+
+    The cached hash is only valid under this process's hash seed, so clones
+    recompute it instead of carrying it along.
+    """
+    state = dict(instance.__dict__)
+    state.pop("_hash", None)
+    return state
+
+
 @dataclass(frozen=True)
 class Style:
     name: str = ""
@@ -157,6 +182,13 @@ class Style:
     table_bordered: bool | None = None
     table_compact: bool | None = None
 
+    def __hash__(self) -> int:
+        # Style chains key the render caches and are hashed once per placed cell.
+        return cached_field_hash(self)
+
+    def __getstate__(self) -> dict[str, object]:
+        return state_without_cached_hash(self)
+
     def merge(self, other: Style) -> Style:
         base_delta = 0.0 if self.font_size_delta is None else self.font_size_delta
         other_delta = 0.0 if other.font_size_delta is None else other.font_size_delta
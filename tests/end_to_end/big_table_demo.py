@@ -4,21 +4,20 @@ from __future__ import annotations
 
 import xpyxl as x
 
+_EVEN_ODD = ("Even", "Odd")
 
-def build_workbook() -> x.SheetNode:
-    rows = []
-    for idx in range(1_000):
-        rows.append(
-            {
-                "Row": idx,
-                "Name": f"Item {idx}",
-                "Category": "Even" if idx % 2 == 0 else "Odd",
-                "Value": idx * 1.5,
-                "Flag": "✔" if idx % 10 == 0 else "",
-            }
-        )
 
-    table = x.table()[rows]
+def build_workbook() -> x.SheetNode:
+    indices = range(1_000)
+    table = x.table()[
+        {
+            "Row": list(indices),
+            "Name": ["Item " + str(idx) for idx in indices],
+            "Category": [_EVEN_ODD[idx & 1] for idx in indices],
+            "Value": [idx * 1.5 for idx in indices],
+            "Flag": ["✔" if idx % 10 == 0 else "" for idx in indices],
+        }
+    ]
 
     return x.sheet("Big Table")[
         x.row(style=[x.text_lg, x.bold])["1k-row table"],
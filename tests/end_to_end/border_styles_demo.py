@@ -3,52 +3,54 @@
 import xpyxl as x
 
 
-def cell_border_section() -> x.Node:
-    title = x.row(style=[x.text_lg, x.bold])["Cell utilities", "", ""]
-    header = x.row(style=[x.text_sm, x.text_gray])["Utility", "Preview", "Notes"]
-
-    variants = [
-        ("x.border_all", [x.border_all, x.border_primary], "All sides + brand color"),
-        ("x.border_top", [x.border_top, x.border_thick], "Top rule"),
-        ("x.border_x", [x.border_x, x.border_green], "Left + right"),
-        ("x.border_y", [x.border_y, x.border_dashed], "Top + bottom dashed"),
-        ("x.border_bottom", [x.border_bottom, x.border_orange], "Underline style"),
-    ]
+_SECTION_TITLE = (x.text_lg, x.bold)
+_SECTION_HEADER = (x.text_sm, x.text_gray)
+_PREVIEW = (x.text_center, x.text_sm)
+
+_CELL_VARIANTS = (
+    ("x.border_all", (x.border_all, x.border_primary), "All sides + brand color"),
+    ("x.border_top", (x.border_top, x.border_thick), "Top rule"),
+    ("x.border_x", (x.border_x, x.border_green), "Left + right"),
+    ("x.border_y", (x.border_y, x.border_dashed), "Top + bottom dashed"),
+    ("x.border_bottom", (x.border_bottom, x.border_orange), "Underline style"),
+)
+
+_ROW_VARIANTS = (
+    (
+        "x.border_y + x.border_muted",
+        (x.border_y, x.border_muted),
+        "Soft banded rows",
+    ),
+    (
+        "x.border_top + x.border_bottom + x.border_thick",
+        (x.border_top, x.border_bottom, x.border_thick),
+        "Strong divider",
+    ),
+    (
+        "x.border_y + x.border_dotted",
+        (x.border_y, x.border_dotted),
+        "Subtle dotted grid",
+    ),
+)
 
-    rows: list[x.Node] = []
-    for label, styles, note in variants:
-        preview = x.cell(style=[*styles, x.text_center, x.text_sm])["Sample"]
-        rows.append(x.row()[label, preview, note])
 
+def cell_border_section() -> x.Node:
+    title = x.row(style=_SECTION_TITLE)["Cell utilities", "", ""]
+    header = x.row(style=_SECTION_HEADER)["Utility", "Preview", "Notes"]
+    rows = [
+        x.row()[label, x.cell(style=(*styles, *_PREVIEW))["Sample"], note]
+        for label, styles, note in _CELL_VARIANTS
+    ]
     return x.vstack(title, header, *rows)
 
 
 def row_border_section() -> x.Node:
-    title = x.row(style=[x.text_lg, x.bold])["Row-level borders", "", ""]
-    header = x.row(style=[x.text_sm, x.text_gray])["Utility", "Preview", "Notes"]
-
-    variants = [
-        (
-            "x.border_y + x.border_muted",
-            [x.border_y, x.border_muted],
-            "Soft banded rows",
-        ),
-        (
-            "x.border_top + x.border_bottom + x.border_thick",
-            [x.border_top, x.border_bottom, x.border_thick],
-            "Strong divider",
-        ),
-        (
-            "x.border_y + x.border_dotted",
-            [x.border_y, x.border_dotted],
-            "Subtle dotted grid",
-        ),
+    title = x.row(style=_SECTION_TITLE)["Row-level borders", "", ""]
+    header = x.row(style=_SECTION_HEADER)["Utility", "Preview", "Notes"]
+    rows = [
+        x.row(style=styles)[label, "Row preview", note]
+        for label, styles, note in _ROW_VARIANTS
     ]
-
-    rows: list[x.Node] = []
-    for label, styles, note in variants:
-        rows.append(x.row(style=styles)[label, "Row preview", note])
-
     return x.vstack(title, header, *rows)
 
 
@@ -1,15 +1,25 @@
 import xpyxl as x
 
+# Shared style chains, named once so every table spells them the same way.
+_RIGHT = (x.text_right,)
+_WRAP = (x.wrap,)
+_MUTED = (x.text_sm, x.text_gray)
+_SECTION_TITLE = (x.text_lg, x.bold)
+_BORDERED_TABLE = (x.table_bordered,)
+_COMPACT_TABLE = (x.table_bordered, x.table_compact)
+_BANDED_TABLE = (x.table_bordered, x.table_banded, x.table_compact)
+_CARD_HEADER = (x.text_sm, x.text_gray, x.text_left)
+_CARD_VALUE = (x.text_2xl, x.bold, x.text_black)
+_CARD_DELTA_UP = (x.text_sm, x.text_green)
+_CARD_DELTA_DOWN = (x.text_sm, x.text_red)
+
 
 def stat_card(title: str, value: str, delta: str, *, positive: bool = True) -> x.Node:
-    delta_style = x.text_green if positive else x.text_red
-    return x.table(
-        header_style=[x.text_sm, x.text_gray, x.text_left],
-        style=[x.table_bordered, x.table_compact],
-    )[
+    delta_style = _CARD_DELTA_UP if positive else _CARD_DELTA_DOWN
+    return x.table(header_style=_CARD_HEADER, style=_COMPACT_TABLE)[
         [
-            {title: x.cell(style=[x.text_2xl, x.bold, x.text_black])[value]},
-            {title: x.cell(style=[x.text_sm, delta_style])[delta]},
+            {title: x.cell(style=_CARD_VALUE)[value]},
+            {title: x.cell(style=delta_style)[delta]},
         ]
     ]
 
@@ -26,74 +36,48 @@ def summary_section() -> x.Node:
     )
 
     regional_performance = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_banded, x.table_compact],
+        header_style=_MUTED,
+        style=_BANDED_TABLE,
+        column_order=["Region", "GM", "Units", "YoY"],
+        column_styles={"GM": _RIGHT, "Units": _RIGHT, "YoY": _RIGHT},
     )[
         [
-            {
-                "Region": "EMEA",
-                "GM": x.cell(style=[x.text_right])["$1.6M"],
-                "Units": x.cell(style=[x.text_right])[1200],
-                "YoY": x.cell(style=[x.text_right])["+18%"],
-            },
-            {
-                "Region": "APAC",
-                "GM": x.cell(style=[x.text_right])["$1.1M"],
-                "Units": x.cell(style=[x.text_right])[930],
-                "YoY": x.cell(style=[x.text_right])["+9%"],
-            },
-            {
-                "Region": "AMER",
-                "GM": x.cell(style=[x.text_right])["$1.5M"],
-                "Units": x.cell(style=[x.text_right])[1480],
-                "YoY": x.cell(style=[x.text_right])["+6%"],
-            },
+            ("EMEA", "$1.6M", 1200, "+18%"),
+            ("APAC", "$1.1M", 930, "+9%"),
+            ("AMER", "$1.5M", 1480, "+6%"),
         ]
     ]
 
     top_opportunities = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_compact],
+        header_style=_MUTED,
+        style=_COMPACT_TABLE,
+        column_order=["Opportunity", "Stage", "Owner", "Value"],
+        column_styles={"Value": _RIGHT},
     )[
         [
-            {
-                "Opportunity": "Atlas Renewals",
-                "Stage": "Negotiation",
-                "Owner": "S. Patel",
-                "Value": x.cell(style=[x.text_right])["$420K"],
-            },
-            {
-                "Opportunity": "Aurora Launch",
-                "Stage": "Proposal",
-                "Owner": "C. Rivers",
-                "Value": x.cell(style=[x.text_right])["$310K"],
-            },
-            {
-                "Opportunity": "Nimbus Edge",
-                "Stage": "Discovery",
-                "Owner": "L. Gomez",
-                "Value": x.cell(style=[x.text_right])["$185K"],
-            },
+            ("Atlas Renewals", "Negotiation", "S. Patel", "$420K"),
+            ("Aurora Launch", "Proposal", "C. Rivers", "$310K"),
+            ("Nimbus Edge", "Discovery", "L. Gomez", "$185K"),
         ]
     ]
 
     key_updates = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered],
+        header_style=_MUTED,
+        style=_BORDERED_TABLE,
     )[
         [
             {
-                "Key Updates": x.cell(style=[x.wrap])[
+                "Key Updates": x.cell(style=_WRAP)[
                     "• APAC backlog cleared; normalization expected by Q4."
                 ]
             },
             {
-                "Key Updates": x.cell(style=[x.wrap])[
+                "Key Updates": x.cell(style=_WRAP)[
                     "• Marketing launch for Nimbus Edge driving 23% lift in leads."
                 ]
             },
             {
-                "Key Updates": x.cell(style=[x.wrap])[
+                "Key Updates": x.cell(style=_WRAP)[
                     "• Supply constraints eased; lead times back under 4 weeks."
                 ]
             },
@@ -113,59 +97,25 @@ def summary_section() -> x.Node:
         x.space(),
         lower_row,
         x.space(),
-        x.row(style=[x.text_sm, x.text_gray])["Generated with xsxpy"],
+        x.row(style=_MUTED)["Generated with xsxpy"],
         gap=1,
     )
 
 
 def raw_data_sheet() -> x.SheetNode:
     data_table = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_compact],
+        header_style=_MUTED,
+        style=_COMPACT_TABLE,
+        column_order=["Region", "Segment", "Owner", "Units", "GM"],
+        column_styles={"Units": _RIGHT, "GM": _RIGHT},
     )[
         [
-            {
-                "Region": "EMEA",
-                "Segment": "Enterprise",
-                "Owner": "S. Patel",
-                "Units": x.cell(style=[x.text_right])[620],
-                "GM": x.cell(style=[x.text_right])["$820K"],
-            },
-            {
-                "Region": "EMEA",
-                "Segment": "Mid-Market",
-                "Owner": "T. Kato",
-                "Units": x.cell(style=[x.text_right])[580],
-                "GM": x.cell(style=[x.text_right])["$780K"],
-            },
-            {
-                "Region": "APAC",
-                "Segment": "Enterprise",
-                "Owner": "L. Gomez",
-                "Units": x.cell(style=[x.text_right])[410],
-                "GM": x.cell(style=[x.text_right])["$610K"],
-            },
-            {
-                "Region": "APAC",
-                "Segment": "SMB",
-                "Owner": "K. Zhao",
-                "Units": x.cell(style=[x.text_right])[520],
-                "GM": x.cell(style=[x.text_right])["$490K"],
-            },
-            {
-                "Region": "AMER",
-                "Segment": "Enterprise",
-                "Owner": "M. Shaw",
-                "Units": x.cell(style=[x.text_right])[870],
-                "GM": x.cell(style=[x.text_right])["$910K"],
-            },
-            {
-                "Region": "AMER",
-                "Segment": "SMB",
-                "Owner": "C. Rivers",
-                "Units": x.cell(style=[x.text_right])[610],
-                "GM": x.cell(style=[x.text_right])["$590K"],
-            },
+            ("EMEA", "Enterprise", "S. Patel", 620, "$820K"),
+            ("EMEA", "Mid-Market", "T. Kato", 580, "$780K"),
+            ("APAC", "Enterprise", "L. Gomez", 410, "$610K"),
+            ("APAC", "SMB", "K. Zhao", 520, "$490K"),
+            ("AMER", "Enterprise", "M. Shaw", 870, "$910K"),
+            ("AMER", "SMB", "C. Rivers", 610, "$590K"),
         ]
     ]
 
@@ -178,12 +128,12 @@ def raw_data_sheet() -> x.SheetNode:
     ]
 
     notes = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered],
+        header_style=_MUTED,
+        style=_BORDERED_TABLE,
     )[
         [
             {
-                "Notes": x.cell(style=[x.wrap])[
+                "Notes": x.cell(style=_WRAP)[
                     "Conversion benchmarks calculated using trailing 90 days."
                 ]
             },
@@ -192,7 +142,7 @@ def raw_data_sheet() -> x.SheetNode:
 
     return x.sheet("Raw Data")[
         x.vstack(
-            x.row(style=[x.text_lg, x.bold])["Source Transactions"],
+            x.row(style=_SECTION_TITLE)["Source Transactions"],
             x.space(),
             data_table,
             totals,
@@ -205,92 +155,50 @@ def raw_data_sheet() -> x.SheetNode:
 
 def pipeline_sheet() -> x.SheetNode:
     funnel = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_compact],
+        header_style=_MUTED,
+        style=_COMPACT_TABLE,
+        column_order=["Stage", "Deals", "Value"],
+        column_styles={"Deals": _RIGHT, "Value": _RIGHT},
     )[
         [
-            {
-                "Stage": "Discovery",
-                "Deals": x.cell(style=[x.text_right])[42],
-                "Value": x.cell(style=[x.text_right])["$1.9M"],
-            },
-            {
-                "Stage": "Qualification",
-                "Deals": x.cell(style=[x.text_right])[33],
-                "Value": x.cell(style=[x.text_right])["$1.4M"],
-            },
-            {
-                "Stage": "Proposal",
-                "Deals": x.cell(style=[x.text_right])[21],
-                "Value": x.cell(style=[x.text_right])["$1.1M"],
-            },
-            {
-                "Stage": "Negotiation",
-                "Deals": x.cell(style=[x.text_right])[14],
-                "Value": x.cell(style=[x.text_right])["$1.0M"],
-            },
-            {
-                "Stage": "Closed Won",
-                "Deals": x.cell(style=[x.text_right])[18],
-                "Value": x.cell(style=[x.text_right])["$1.5M"],
-            },
+            ("Discovery", 42, "$1.9M"),
+            ("Qualification", 33, "$1.4M"),
+            ("Proposal", 21, "$1.1M"),
+            ("Negotiation", 14, "$1.0M"),
+            ("Closed Won", 18, "$1.5M"),
         ]
     ]
 
     forecast = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_compact],
+        header_style=_MUTED,
+        style=_COMPACT_TABLE,
+        column_order=["Scenario", "Probability", "Forecast"],
+        column_styles={"Probability": _RIGHT, "Forecast": _RIGHT},
     )[
         [
-            {
-                "Scenario": "Commit",
-                "Probability": x.cell(style=[x.text_right])["75%"],
-                "Forecast": x.cell(style=[x.text_right])["$3.2M"],
-            },
-            {
-                "Scenario": "Best",
-                "Probability": x.cell(style=[x.text_right])["50%"],
-                "Forecast": x.cell(style=[x.text_right])["$4.5M"],
-            },
-            {
-                "Scenario": "Upside",
-                "Probability": x.cell(style=[x.text_right])["25%"],
-                "Forecast": x.cell(style=[x.text_right])["$6.1M"],
-            },
+            ("Commit", "75%", "$3.2M"),
+            ("Best", "50%", "$4.5M"),
+            ("Upside", "25%", "$6.1M"),
         ]
     ]
 
     team_heatmap = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_banded, x.table_compact],
+        header_style=_MUTED,
+        style=_BANDED_TABLE,
+        column_order=["Owner", "Active Deals", "Win Rate"],
+        column_styles={"Active Deals": _RIGHT, "Win Rate": _RIGHT},
     )[
         [
-            {
-                "Owner": "S. Patel",
-                "Active Deals": x.cell(style=[x.text_right])[18],
-                "Win Rate": x.cell(style=[x.text_right])["64%"],
-            },
-            {
-                "Owner": "C. Rivers",
-                "Active Deals": x.cell(style=[x.text_right])[15],
-                "Win Rate": x.cell(style=[x.text_right])["58%"],
-            },
-            {
-                "Owner": "L. Gomez",
-                "Active Deals": x.cell(style=[x.text_right])[12],
-                "Win Rate": x.cell(style=[x.text_right])["54%"],
-            },
-            {
-                "Owner": "T. Kato",
-                "Active Deals": x.cell(style=[x.text_right])[11],
-                "Win Rate": x.cell(style=[x.text_right])["49%"],
-            },
+            ("S. Patel", 18, "64%"),
+            ("C. Rivers", 15, "58%"),
+            ("L. Gomez", 12, "54%"),
+            ("T. Kato", 11, "49%"),
         ]
     ]
 
     return x.sheet("Pipeline")[
         x.vstack(
-            x.row(style=[x.text_lg, x.bold])["Pipeline & Forecast"],
+            x.row(style=_SECTION_TITLE)["Pipeline & Forecast"],
             x.space(),
             x.hstack(funnel, forecast, gap=2),
             x.space(),
@@ -302,36 +210,21 @@ def pipeline_sheet() -> x.SheetNode:
 
 def glossary_sheet() -> x.SheetNode:
     utility_grid = x.table(
-        header_style=[x.text_sm, x.text_gray],
-        style=[x.table_bordered, x.table_compact],
+        header_style=_MUTED,
+        style=_COMPACT_TABLE,
+        column_order=["Utility", "Description", "Example"],
     )[
         [
-            {
-                "Utility": "text_blue",
-                "Description": "Accent headline color",
-                "Example": "Q3 Revenue",
-            },
-            {
-                "Utility": "bg_success",
-                "Description": "Positive badge background",
-                "Example": "+14% Revenue",
-            },
-            {
-                "Utility": "wrap",
-                "Description": "Wrap long text inside cells",
-                "Example": "Supply constraints eased...",
-            },
-            {
-                "Utility": "number_precision",
-                "Description": "Two-decimal numeric format",
-                "Example": "42100.00",
-            },
+            ("text_blue", "Accent headline color", "Q3 Revenue"),
+            ("bg_success", "Positive badge background", "+14% Revenue"),
+            ("wrap", "Wrap long text inside cells", "Supply constraints eased..."),
+            ("number_precision", "Two-decimal numeric format", "42100.00"),
         ]
     ]
 
     return x.sheet("Glossary")[
         x.vstack(
-            x.row(style=[x.text_lg, x.bold])["Utility Cheatsheet"],
+            x.row(style=_SECTION_TITLE)["Utility Cheatsheet"],
             x.space(),
             utility_grid,
             gap=1,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+from dataclasses import replace
 from pathlib import Path
 from types import ModuleType
 
@@ -94,24 +95,7 @@ def test_combined_workbook() -> None:
                 if original_name in seen_sheet_names:
                     # Rename with module prefix
                     new_name = f"{module_name}-{original_name}"
-                    if isinstance(sheet, ImportedSheetNode):
-                        all_sheets.append(
-                            ImportedSheetNode(
-                                name=new_name,
-                                source=sheet.source,
-                                source_sheet=sheet.source_sheet,
-                                show_gridlines=sheet.show_gridlines,
-                            )
-                        )
-                    else:
-                        all_sheets.append(
-                            SheetNode(
-                                name=new_name,
-                                items=sheet.items,
-                                background_color=sheet.background_color,
-                                show_gridlines=sheet.show_gridlines,
-                            )
-                        )
+                    all_sheets.append(replace(sheet, name=new_name))
                     seen_sheet_names.add(new_name)
                 else:
                     all_sheets.append(sheet)
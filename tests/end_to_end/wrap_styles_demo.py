@@ -10,6 +10,18 @@ LONG_TEXT = (
 )
 
 
+def wrap_card(label: str, styles: list[x.Style], note: str) -> x.Node:
+    return x.table(
+        header_style=[x.text_sm, x.text_gray],
+        style=[x.table_bordered, x.table_compact],
+    )[
+        [
+            {label: x.cell(style=styles)[LONG_TEXT]},
+            {label: x.cell(style=[x.text_sm, x.text_gray])[note]},
+        ]
+    ]
+
+
 def wrap_variants_gallery() -> x.Node:
     entries = [
         ("Default", [], "Excel auto wrapping based on column width"),
@@ -31,20 +43,7 @@ def wrap_variants_gallery() -> x.Node:
         ),
     ]
 
-    cards: list[x.Node] = []
-    for label, styles, note in entries:
-        cards.append(
-            x.table(
-                header_style=[x.text_sm, x.text_gray],
-                style=[x.table_bordered, x.table_compact],
-            )[
-                [
-                    {label: x.cell(style=styles)[LONG_TEXT]},
-                    {label: x.cell(style=[x.text_sm, x.text_gray])[note]},
-                ]
-            ]
-        )
-
+    cards = [wrap_card(label, styles, note) for label, styles, note in entries]
     return x.hstack(*cards, gap=2)
 
 
@@ -57,39 +56,34 @@ def wrap_variants_section() -> x.Node:
     )
 
 
+def wrap_column(title: str, style: x.Style, note: str) -> x.Node:
+    return x.col(style=[style])[
+        x.cell(style=[x.bold])[title],
+        LONG_TEXT,
+        x.cell(style=[x.text_sm, x.text_gray])[note],
+    ]
+
+
 def mix_and_match_section() -> x.Node:
     instructions = x.row(style=[x.text_sm, x.text_gray])[
         "Stack wrapping utilities at the row/column level too."
     ]
 
-    wrap_stack = x.col(style=[x.wrap])[
-        x.cell(style=[x.bold])["Row wrap"],
-        LONG_TEXT,
-        x.cell(style=[x.text_sm, x.text_gray])[
-            "Row style enforces wrapping on every cell."
-        ],
-    ]
-    nowrap_stack = x.col(style=[x.nowrap])[
-        x.cell(style=[x.bold])["Row nowrap"],
-        LONG_TEXT,
-        x.cell(style=[x.text_sm, x.text_gray])["Keeps rows to a single line."],
-    ]
-    shrink_stack = x.col(style=[x.wrap_shrink])[
-        x.cell(style=[x.bold])["Wrap & shrink"],
-        LONG_TEXT,
-        x.cell(style=[x.text_sm, x.text_gray])["Great for skinny annotation columns."],
-    ]
-    overflow_stack = x.col(style=[x.allow_overflow])[
-        x.cell(style=[x.bold])["Allow overflow"],
-        LONG_TEXT,
-        x.cell(style=[x.text_sm, x.text_gray])[
-            "Column width stays fixed; Excel shows spillover."
-        ],
+    variants = [
+        ("Row wrap", x.wrap, "Row style enforces wrapping on every cell."),
+        ("Row nowrap", x.nowrap, "Keeps rows to a single line."),
+        ("Wrap & shrink", x.wrap_shrink, "Great for skinny annotation columns."),
+        (
+            "Allow overflow",
+            x.allow_overflow,
+            "Column width stays fixed; Excel shows spillover.",
+        ),
     ]
+    stacks = [wrap_column(title, style, note) for title, style, note in variants]
 
     return x.vstack(
         instructions,
-        x.hstack(wrap_stack, nowrap_stack, shrink_stack, overflow_stack, gap=2),
+        x.hstack(*stacks, gap=2),
         style=[x.border_all, x.row_width(28)],
     )
 
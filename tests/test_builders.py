@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from io import BytesIO
+
+import openpyxl
 import pytest
 
 import xpyxl as x
@@ -58,3 +61,139 @@ def test_workbook_validates_direct_sheet_nodes() -> None:
 def test_workbook_validates_direct_imported_sheet_nodes() -> None:
     with pytest.raises(ValueError, match="apostrophe"):
         x.workbook()[x.ImportedSheetNode(name="'bad", source="t.xlsx", source_sheet="S")]
+
+
+def test_table_accepts_record_generator() -> None:
+    records = [{"Region": "EMEA", "Units": 1200}, {"Region": "APAC", "Units": 900}]
+
+    from_list = x.table()[records]
+    from_generator = x.table()[(record for record in records)]
+
+    assert from_generator == from_list
+    assert from_generator.header is not None
+    assert [cell.value for cell in from_generator.header.cells] == ["Region", "Units"]
+
+
+def test_table_accepts_positional_row_generator() -> None:
+    rows = [("EMEA", 1200), ("APAC", 900)]
+
+    from_list = x.table(column_order=["Region", "Units"])[rows]
+    from_generator = x.table(column_order=["Region", "Units"])[
+        (row for row in rows)
+    ]
+
+    assert from_generator == from_list
+    assert from_generator.header is not None
+    assert [cell.value for cell in from_generator.header.cells] == ["Region", "Units"]
+    assert [cell.value for cell in from_generator.rows[1].cells] == ["APAC", 900]
+
+
+def test_table_dict_of_lists_pads_missing_ordered_columns() -> None:
+    table = x.table(column_order=["Region", "Notes"])[
+        {"Region": ["EMEA", "APAC"], "Units": [1200, 900]}
+    ]
+
+    assert table.header is not None
+    assert [cell.value for cell in table.header.cells] == ["Region", "Notes", "Units"]
+    assert [[cell.value for cell in row.cells] for row in table.rows] == [
+        ["EMEA", None, 1200],
+        ["APAC", None, 900],
+    ]
+
+
+def test_table_column_order_names_positional_rows() -> None:
+    table = x.table(column_order=["Region", "Units"], header_style=[x.bold])[
+        [("EMEA", 1200), ("APAC", 900)]
+    ]
+
+    assert table.header is not None
+    assert [cell.value for cell in table.header.cells] == ["Region", "Units"]
+    assert table.header.styles == (x.bold,)
+    assert [[cell.value for cell in row.cells] for row in table.rows] == [
+        ["EMEA", 1200],
+        ["APAC", 900],
+    ]
+
+
+def test_table_column_order_rejects_mismatched_positional_rows() -> None:
+    with pytest.raises(ValueError, match="column_order names 2 columns"):
+        x.table(column_order=["A", "B"])[[(1, 2, 3), (4,)]]
+
+
+def test_table_column_order_does_not_add_header_to_row_nodes() -> None:
+    rows = [x.row()["EMEA", 1200], x.row()["APAC", 900]]
+    table = x.table(column_order=["Region", "Units"])[rows]
+
+    assert table.header is None
+    assert table.rows == tuple(rows)
+
+
+def test_stack_hoists_lone_same_axis_child() -> None:
+    outer_style = x.Style(bold=True)
+    inner = x.vstack(x.row()["a"], x.row()["b"], gap=2, style=[x.text_sm])
+    stacked = x.vstack(inner, style=[outer_style])
+
+    assert stacked.items == inner.items
+    assert stacked.gap == 2
+    assert stacked.styles == (outer_style, *inner.styles)
+
+    across = x.hstack(inner)
+    assert across.items == (inner,)
+
+
+def test_table_column_styles_map_names_to_positions() -> None:
+    table = x.table(column_styles={"Units": [x.text_right]})[
+        {"Region": ["EMEA", "APAC"], "Units": [1200, 900], "Notes": ["", ""]}
+    ]
+
+    assert table.column_styles == ((), (x.text_right,))
+
+
+def test_table_column_styles_reject_unknown_columns() -> None:
+    with pytest.raises(ValueError, match="unknown table columns"):
+        x.table(column_styles={"Price": [x.text_right]})[
+            [{"Region": "EMEA", "Units": 1200}]
+        ]
+
+
+def test_table_column_styles_validate_against_column_order_for_row_nodes() -> None:
+    rows = [x.row()["EMEA", 1200]]
+    table = x.table(
+        column_order=["Region", "Units"], column_styles={"Units": [x.bold]}
+    )[rows]
+
+    assert table.header is None
+    assert table.column_styles == ((), (x.bold,))
+
+
+def test_table_column_styles_require_column_names_for_positional_rows() -> None:
+    with pytest.raises(ValueError, match="requires column_order or keyed rows"):
+        x.table(column_styles={"Units": [x.bold]})[[("EMEA", 1200)]]
+
+
+def test_table_column_styles_allow_empty_body() -> None:
+    table = x.table(column_styles={"A": [x.bold]})[[]]
+
+    assert table.rows == ()
+    assert table.column_styles == ()
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter"])
+def test_table_column_styles_apply_to_body_cells(engine: str) -> None:
+    workbook = x.workbook()[
+        x.sheet("Data")[
+            x.table(
+                column_order=["Region", "Units"],
+                column_styles={"Units": [x.text_right]},
+            )[[("EMEA", 1200), ("APAC", x.cell(style=[x.text_left])[900])]]
+        ]
+    ]
+
+    data = workbook.save(engine=engine)  # type: ignore[arg-type]
+    assert data is not None
+    ws = openpyxl.load_workbook(BytesIO(data))["Data"]
+
+    assert ws["B1"].alignment.horizontal == "center"
+    assert ws["B2"].alignment.horizontal == "right"
+    assert ws["B3"].alignment.horizontal == "left"
+    assert ws["A2"].alignment.horizontal != "right"
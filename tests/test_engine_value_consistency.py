@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tempfile
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
 from pathlib import Path
 
@@ -94,3 +95,47 @@ def test_merged_cell_values_follow_same_rules(engine: str) -> None:
         assert ws["A1"].value == str(point)
         assert ws["A2"].data_type == "f"
         assert ws["A3"].value == 2.5
+
+
+def test_openpyxl_shared_style_keeps_value_specific_formats() -> None:
+    # openpyxl picks a date number format from the value itself; cells that
+    # share a style with a date must not inherit it (nor lose it).
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "openpyxl.xlsx"
+        bold = x.cell(style=[x.bold])
+        workbook = x.workbook()[
+            x.sheet("S")[
+                x.row()[bold["a"], bold[date(2025, 1, 2)], bold["b"], bold[3]]
+            ]
+        ]
+        workbook.save(output_path, engine="openpyxl")
+
+        ws = openpyxl.load_workbook(output_path)["S"]
+        assert all(ws.cell(row=1, column=col).font.b for col in range(1, 5))
+        assert ws["B1"].is_date
+        assert ws["C1"].number_format == "General"
+        assert ws["D1"].number_format == "General"
+
+
+def test_openpyxl_wrap_and_shrink_alignment_is_written() -> None:
+    # xlsxwriter drops shrink_to_fit when text wrapping is on, so this
+    # checks the openpyxl alignment path on its own.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "openpyxl.xlsx"
+        workbook = x.workbook()[
+            x.sheet("S")[
+                x.row()[
+                    x.cell(style=[x.wrap])["a"],
+                    x.cell(style=[x.wrap_shrink])["b"],
+                    "c",
+                ]
+            ]
+        ]
+        workbook.save(output_path, engine="openpyxl")
+
+        ws = openpyxl.load_workbook(output_path)["S"]
+        assert ws["A1"].alignment.wrap_text
+        assert not ws["A1"].alignment.shrink_to_fit
+        assert ws["B1"].alignment.wrap_text
+        assert ws["B1"].alignment.shrink_to_fit
+        assert not ws["C1"].alignment.wrap_text
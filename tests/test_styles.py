@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 import xpyxl as x
@@ -34,3 +37,23 @@ def test_normalize_hex_rejects_wrong_length() -> None:
 def test_normalize_hex_rejects_empty() -> None:
     with pytest.raises(ValueError, match="cannot be empty"):
         x.normalize_hex("   ")
+
+
+def test_style_hash_is_stable_and_matches_equality() -> None:
+    first = x.Style(bold=True, fill_color="#FFFFFF")
+    second = x.Style(bold=True, fill_color="#FFFFFF")
+    assert first == second
+    assert hash(first) == hash(second) == hash(first)
+    assert hash(first) != hash(x.Style(bold=False, fill_color="#FFFFFF"))
+
+
+def test_style_copies_do_not_carry_cached_hash() -> None:
+    style = x.Style(bold=True, fill_color="#FFFFFF")
+    hash(style)
+
+    # The cached hash depends on the hash seed, so it must not travel with
+    # pickles (or copies) into a process where it would be stale.
+    for clone in (pickle.loads(pickle.dumps(style)), copy.copy(style)):
+        assert "_hash" not in clone.__dict__
+        assert clone == style
+        assert hash(clone) == hash(style)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import tempfile
 from datetime import date, datetime
+from io import BytesIO
 from pathlib import Path
 
 import openpyxl
 import pytest
 
 import xpyxl as x
+from xpyxl.engines import XlsxWriterEngine
+from xpyxl.render import render_sheet
 
 
 @pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter", "hybrid"])
@@ -77,3 +80,57 @@ def test_xlsxwriter_applies_custom_date_formats() -> None:
         assert ws["B1"].is_date
         assert not isinstance(ws["A1"].value, str)
         assert not isinstance(ws["B1"].value, str)
+
+
+def test_xlsxwriter_alternating_styles_keep_their_formats() -> None:
+    workbook = x.workbook()[
+        x.sheet("Runs")[
+            x.row()[
+                x.cell(style=[x.bold])["a"],
+                x.cell(style=[x.bold])["b"],
+                "c",
+                x.cell(style=[x.bold])["d"],
+                "e",
+            ]
+        ]
+    ]
+
+    data = workbook.save(engine="xlsxwriter")
+    assert data is not None
+
+    ws = openpyxl.load_workbook(BytesIO(data))["Runs"]
+    assert [ws.cell(row=1, column=col).font.b for col in range(1, 6)] == [
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_xlsxwriter_equal_resolved_styles_share_one_format() -> None:
+    def format_count(*cells: object) -> int:
+        engine = XlsxWriterEngine()
+        render_sheet(engine, x.sheet("S")[x.row()[*cells]])
+        return len(engine._workbook.formats)
+
+    # [bold] and [bold, Style()] are different chains that resolve to equal
+    # styles, so they must not register a second format.
+    assert format_count(
+        x.cell(style=[x.bold])["a"],
+        x.cell(style=[x.bold, x.Style()])["b"],
+        x.cell(style=[x.italic])["c"],
+    ) == format_count(
+        x.cell(style=[x.bold])["a"],
+        x.cell(style=[x.italic])["c"],
+    )
+
+
+def test_xlsxwriter_save_to_buffer_shares_finalized_output() -> None:
+    engine = XlsxWriterEngine()
+    render_sheet(engine, x.sheet("S")[x.row()["a"]])
+
+    buffer = engine.save_to_buffer()
+    assert buffer.tell() == 0
+    assert openpyxl.load_workbook(buffer)["S"]["A1"].value == "a"
+    assert engine.save(None) == buffer.getvalue()
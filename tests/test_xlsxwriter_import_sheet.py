@@ -504,5 +504,100 @@ def test_case_insensitive_table_name_collision(engine: str) -> None:
         assert len(result_wb["Two"].tables) == 1
 
 
+@pytest.mark.parametrize("engine", ["openpyxl", "hybrid"])
+def test_import_sheet_shared_source_styles_stay_independent(engine: str) -> None:
+    """Cells sharing a source style reuse one mapping without aliasing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        source_path = tmppath / "source.xlsx"
+        output_path = tmppath / f"output-{engine}.xlsx"
+
+        source_wb = openpyxl.Workbook()
+        source_ws = source_wb.active
+        if source_ws is None:
+            raise RuntimeError("Expected an active worksheet")
+        source_ws.title = "Data"
+        for row in range(1, 4):
+            cell = source_ws.cell(row=row, column=1, value=row)
+            cell.font = Font(bold=True, color="FF123456")
+            cell.number_format = "0.00"
+        source_ws["B1"] = "plain"
+        source_wb.save(source_path)
+
+        workbook = x.workbook()[x.import_sheet(source_path, "Data")]
+        workbook.save(output_path, engine=engine)  # type: ignore[arg-type]
+
+        result_ws = openpyxl.load_workbook(output_path)["Data"]
+        for row in range(1, 4):
+            cell = result_ws.cell(row=row, column=1)
+            assert cell.font.b is True
+            assert cell.font.color is not None
+            assert cell.font.color.rgb == "FF123456"
+            assert cell.number_format == "0.00"
+        assert not result_ws["B1"].font.b
+        assert result_ws["B1"].number_format == "General"
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "hybrid"])
+def test_import_sheet_from_loaded_openpyxl_workbook(engine: str) -> None:
+    source_wb = openpyxl.Workbook()
+    source_ws = source_wb.active
+    if source_ws is None:
+        raise RuntimeError("Expected an active worksheet")
+    source_ws.title = "Data"
+    source_ws["A1"] = "kept"
+    source_ws["A1"].font = Font(bold=True)
+    source_ws["B2"] = "=1+1"
+    source_cells = set(source_ws._cells)  # type: ignore[attr-defined]
+
+    workbook = x.workbook()[
+        x.sheet("Gen")[x.row()["Data"]],
+        x.import_sheet(source_wb, "Data", name="One"),
+        x.import_sheet(source_wb, "Data", name="Two"),
+    ]
+    data = workbook.save(engine=engine)  # type: ignore[arg-type]
+    assert data is not None
+
+    from io import BytesIO
+
+    result_wb = openpyxl.load_workbook(BytesIO(data))
+    assert result_wb.sheetnames == ["Gen", "One", "Two"]
+    for name in ("One", "Two"):
+        assert result_wb[name]["A1"].value == "kept"
+        assert result_wb[name]["A1"].font.b
+        assert result_wb[name]["B2"].value == "=1+1"
+    # The caller's workbook is read, not modified.
+    assert source_wb.sheetnames == ["Data"]
+    # No blank cells were materialized across the source's used range.
+    assert set(source_ws._cells) == source_cells  # type: ignore[attr-defined]
+
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "hybrid"])
+def test_import_sheet_from_read_only_openpyxl_workbook(engine: str) -> None:
+    from io import BytesIO
+
+    source_wb = openpyxl.Workbook()
+    source_ws = source_wb.active
+    if source_ws is None:
+        raise RuntimeError("Expected an active worksheet")
+    source_ws.title = "Data"
+    source_ws["A1"] = "kept"
+    source_ws["A1"].font = Font(bold=True)
+    source_ws["C3"] = 5
+    buffer = BytesIO()
+    source_wb.save(buffer)
+    read_only_wb = openpyxl.load_workbook(BytesIO(buffer.getvalue()), read_only=True)
+
+    workbook = x.workbook()[x.import_sheet(read_only_wb, "Data", name="One")]
+    data = workbook.save(engine=engine)  # type: ignore[arg-type]
+    assert data is not None
+
+    result_ws = openpyxl.load_workbook(BytesIO(data))["One"]
+    assert result_ws["A1"].value == "kept"
+    assert result_ws["A1"].font.b
+    assert result_ws["C3"].value == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__])